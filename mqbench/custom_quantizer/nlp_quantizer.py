@@ -13,16 +13,24 @@ class AcademicNLPQuantizer(ModelQuantizer):
     We should uantize Linear / Embedding weights.
     Linear / Matmul layer inputs(activations).
     """
-    @property
-    def function_type_to_quant_input(self) -> list:
-        return [
+    def __init__(self, extra_quantizer_dict, extra_fuse_dict):
+        super().__init__(extra_quantizer_dict, extra_fuse_dict)
+        # Looked up once per node while walking the graph, so build them once.
+        self._function_type_to_quant_input = (
             # Matmul in MSA
-            torch.matmul
-        ] + self.additional_function_type
+            torch.matmul,
+            *self.additional_function_type
+        )
+        self._module_type_to_quant_input = (
+            # Linear
+            torch.nn.qat.modules.linear.Linear,
+            *self.additional_module_type
+        )
+
+    @property
+    def function_type_to_quant_input(self) -> tuple:
+        return self._function_type_to_quant_input
 
     @property
     def module_type_to_quant_input(self) -> tuple:
-        return (
-            # Linear
-            torch.nn.qat.modules.linear.Linear,
-        ) + self.additional_module_type
\ No newline at end of file
+        return self._module_type_to_quant_input